@@ -0,0 +1,53 @@
+"""Lower-case the status enum labels created by the initial migration
+
+Revision ID: lowercase_status_labels
+Revises: add_retry_tracking
+Create Date: 2026-10-17 08:50:00.000000
+
+"""
+from alembic import op
+
+revision = 'lowercase_status_labels'
+down_revision = 'add_retry_tracking'
+branch_labels = None
+depends_on = None
+
+ENUM_TYPES = ('news_content_status', 'news_link_status')
+LABELS = ('pending', 'completed')
+
+
+def _rename_label(enum_name: str, old: str, new: str) -> None:
+    """Rename an enum label if old exists and new does not yet."""
+    op.execute(f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid
+                WHERE t.typname = '{enum_name}' AND e.enumlabel = '{old}'
+            ) AND NOT EXISTS (
+                SELECT 1 FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid
+                WHERE t.typname = '{enum_name}' AND e.enumlabel = '{new}'
+            ) THEN
+                ALTER TYPE {enum_name} RENAME VALUE '{old}' TO '{new}';
+            END IF;
+        END $$;
+    """)
+
+
+def upgrade() -> None:
+    """
+    The initial migration created both enums with 'PENDING'/'COMPLETED',
+    while StatusEnum and every later migration use lower-case labels.
+    Rename them so the 'pending' predicates of the following migrations
+    match stored values.
+    """
+    for enum_name in ENUM_TYPES:
+        for label in LABELS:
+            _rename_label(enum_name, label.upper(), label)
+
+
+def downgrade() -> None:
+    """Restore the upper-case labels."""
+    for enum_name in ENUM_TYPES:
+        for label in LABELS:
+            _rename_label(enum_name, label, label.upper())
@@ -0,0 +1,48 @@
+"""Add trigram GIN indexes on news title and content
+
+Revision ID: add_news_trigram_indexes
+Revises: lowercase_status_labels
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+
+revision = 'add_news_trigram_indexes'
+down_revision = 'lowercase_status_labels'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Enable pg_trgm and add trigram GIN indexes so ILIKE substring
+    searches on news title/content use an index scan.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        'ix_news_title_trgm',
+        'news',
+        ['title'],
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+    op.create_index(
+        'ix_news_content_trgm',
+        'news',
+        ['content'],
+        postgresql_using='gin',
+        postgresql_ops={'content': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the trigram indexes.
+
+    Note: The extension is left installed since other objects may
+    depend on it.
+    """
+    op.drop_index('ix_news_content_trgm', table_name='news')
+    op.drop_index('ix_news_title_trgm', table_name='news')
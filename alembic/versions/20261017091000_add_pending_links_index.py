@@ -0,0 +1,47 @@
+"""Add partial covering index for pending links per source
+
+Revision ID: add_pending_links_index
+Revises: add_news_trigram_indexes
+Create Date: 2026-10-17 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_pending_links_index'
+down_revision = 'add_news_trigram_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add a partial index on news_links (source, published_datetime) limited
+    to PENDING rows, matching the filter and sort order of
+    get_pending_links_by_source. Only link is INCLUDEd: tried_count is
+    updated on every retry and indexing it would rule out HOT updates.
+    Built CONCURRENTLY so the crawlers keep writing, then ANALYZEd so the
+    planner picks it up immediately.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_news_links_source_pending',
+            'news_links',
+            ['source', 'published_datetime'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_include=['link'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.execute("ANALYZE news_links")
+
+
+def downgrade() -> None:
+    """Drop the pending links index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_news_links_source_pending',
+            table_name='news_links',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
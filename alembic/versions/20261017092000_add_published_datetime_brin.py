@@ -0,0 +1,43 @@
+"""Add BRIN indexes on published_datetime
+
+Revision ID: add_published_datetime_brin
+Revises: add_pending_links_index
+Create Date: 2026-10-17 09:20:00.000000
+
+"""
+from alembic import op
+
+revision = 'add_published_datetime_brin'
+down_revision = 'add_pending_links_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add BRIN indexes on news.published_datetime and
+    news_links.published_datetime. Both tables are append-mostly and
+    roughly time-ordered, so a BRIN index serves date-range scans at a
+    fraction of a B-tree's size.
+    """
+    op.create_index(
+        'ix_news_published_datetime_brin',
+        'news',
+        ['published_datetime'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 64},
+    )
+
+    op.create_index(
+        'ix_news_links_published_datetime_brin',
+        'news_links',
+        ['published_datetime'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 64},
+    )
+
+
+def downgrade() -> None:
+    """Drop the BRIN indexes."""
+    op.drop_index('ix_news_links_published_datetime_brin', table_name='news_links')
+    op.drop_index('ix_news_published_datetime_brin', table_name='news')
@@ -0,0 +1,45 @@
+"""Add partial covering index for pending news per source
+
+Revision ID: add_pending_news_index
+Revises: add_published_datetime_brin
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_pending_news_index'
+down_revision = 'add_published_datetime_brin'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add a partial index on news (source, published_datetime) limited to
+    PENDING rows, matching get_pending_news_batch*. Built CONCURRENTLY so
+    the embedding scheduler keeps writing, then ANALYZEd so the planner
+    picks it up immediately.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_news_source_pending',
+            'news',
+            ['source', 'published_datetime'],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_include=['link'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.execute("ANALYZE news")
+
+
+def downgrade() -> None:
+    """Drop the pending news index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_news_source_pending',
+            table_name='news',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,35 @@
+"""Lower fillfactor on news_links for HOT retry updates
+
+Revision ID: set_status_tables_fillfactor
+Revises: add_pending_news_index
+Create Date: 2026-10-17 09:40:00.000000
+
+"""
+from alembic import op
+
+revision = 'set_status_tables_fillfactor'
+down_revision = 'add_pending_news_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Leave 30% free space on each news_links heap page so retry updates,
+    which touch no indexed column (tried_count / last_tried_at), can place
+    the new tuple version on the same page (HOT) and skip inserting into
+    the link and BRIN indexes. news keeps the default: its only updates
+    are status changes, which are not HOT since status appears in the
+    partial index predicates.
+
+    Only newly written pages honour the setting. Existing pages are
+    rewritten by a one-off `VACUUM FULL news_links`, which takes an
+    ACCESS EXCLUSIVE lock and is left to a maintenance window rather than
+    run here.
+    """
+    op.execute("ALTER TABLE news_links SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    """Restore the default fillfactor."""
+    op.execute("ALTER TABLE news_links RESET (fillfactor)")
@@ -0,0 +1,38 @@
+"""Add in_progress status value
+
+Revision ID: add_in_progress_status
+Revises: set_status_tables_fillfactor
+Create Date: 2026-10-17 09:50:00.000000
+
+"""
+from alembic import op
+
+revision = 'add_in_progress_status'
+down_revision = 'set_status_tables_fillfactor'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add 'in_progress' to both status enum types. News rows move to it when
+    a worker claims them with FOR UPDATE SKIP LOCKED; news_links shares
+    StatusEnum, so its type gets the value too.
+
+    ALTER TYPE ... ADD VALUE runs outside the migration transaction so the
+    value is usable as soon as the migration finishes.
+    """
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE news_content_status ADD VALUE IF NOT EXISTS 'in_progress'")
+        op.execute("ALTER TYPE news_link_status ADD VALUE IF NOT EXISTS 'in_progress'")
+
+
+def downgrade() -> None:
+    """
+    Return claimed rows to 'pending'.
+
+    Note: PostgreSQL cannot drop an enum value, so 'in_progress' stays in
+    the types; nothing writes it after downgrade.
+    """
+    op.execute("UPDATE news SET status = 'pending' WHERE status = 'in_progress'")
+    op.execute("UPDATE news_links SET status = 'pending' WHERE status = 'in_progress'")
@@ -0,0 +1,37 @@
+"""Drop news_links status/tried_count indexes superseded by the pending index
+
+Revision ID: drop_status_tried_count_indexes
+Revises: add_in_progress_status
+Create Date: 2026-10-17 09:55:00.000000
+
+"""
+from alembic import op
+
+revision = 'drop_status_tried_count_indexes'
+down_revision = 'add_in_progress_status'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Drop ix_news_links_status_tried_count and ix_news_links_tried_count.
+
+    The pending-queue reads are served by ix_news_links_source_pending.
+    With these two indexes gone, retry updates (tried_count,
+    last_tried_at) touch no indexed column and can stay HOT under the
+    lowered fillfactor. Status changes still update the partial indexes,
+    whose predicates reference status.
+    """
+    op.drop_index('ix_news_links_status_tried_count', table_name='news_links', if_exists=True)
+    op.drop_index('ix_news_links_tried_count', table_name='news_links', if_exists=True)
+
+
+def downgrade() -> None:
+    """Recreate the dropped indexes."""
+    op.create_index('ix_news_links_tried_count', 'news_links', ['tried_count'])
+    op.create_index(
+        'ix_news_links_status_tried_count',
+        'news_links',
+        ['status', 'tried_count']
+    )
@@ -0,0 +1,91 @@
+"""Store status as a smallint code instead of a PostgreSQL enum
+
+Revision ID: status_to_smallint
+Revises: drop_status_tried_count_indexes
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'status_to_smallint'
+down_revision = 'drop_status_tried_count_indexes'
+branch_labels = None
+depends_on = None
+
+# Mirrors db_models.STATUS_CODES; frozen here so the migration does not
+# change if the model mapping does.
+STATUS_CODES = {'pending': 0, 'completed': 1, 'failed': 2, 'in_progress': 3}
+
+TABLES = {
+    'news_links': 'news_link_status',
+    'news': 'news_content_status',
+}
+
+PENDING_INDEXES = {
+    'news_links': ('ix_news_links_source_pending', ['link']),
+    'news': ('ix_news_source_pending', ['link']),
+}
+
+
+def _create_pending_indexes(predicate: str) -> None:
+    """Build the pending partial indexes CONCURRENTLY, then ANALYZE."""
+    with op.get_context().autocommit_block():
+        for table, (name, include) in PENDING_INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                ['source', 'published_datetime'],
+                postgresql_where=sa.text(predicate),
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.execute(f"ANALYZE {table}")
+
+
+def upgrade() -> None:
+    """
+    Convert news.status and news_links.status to smallint with a CHECK
+    constraint, drop the enum types and rebuild the pending partial
+    indexes on the integer predicate.
+
+    Needs a maintenance window: the type change rewrites both tables and
+    all their indexes (including the trigram GIN indexes) under an ACCESS
+    EXCLUSIVE lock. Only the pending indexes, which have to be dropped
+    first, are rebuilt CONCURRENTLY once the rewrite has committed.
+    """
+    case = " ".join(
+        f"WHEN '{label}' THEN {code}" for label, code in STATUS_CODES.items()
+    )
+    codes = ", ".join(str(code) for code in STATUS_CODES.values())
+
+    for table, enum_name in TABLES.items():
+        op.drop_index(PENDING_INDEXES[table][0], table_name=table)
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN status TYPE smallint "
+            f"USING (CASE status::text {case} END)"
+        )
+        op.create_check_constraint(f"ck_{table}_status", table, f"status IN ({codes})")
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+    _create_pending_indexes(f"status = {STATUS_CODES['pending']}")
+
+
+def downgrade() -> None:
+    """Restore the enum types (lower-case labels) and the text predicates; same locking as upgrade."""
+    labels = ", ".join(f"'{label}'" for label in STATUS_CODES)
+    case = " ".join(
+        f"WHEN {code} THEN '{label}'" for label, code in STATUS_CODES.items()
+    )
+
+    for table, enum_name in TABLES.items():
+        op.drop_index(PENDING_INDEXES[table][0], table_name=table)
+        op.drop_constraint(f"ck_{table}_status", table, type_='check')
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM ({labels})")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN status TYPE {enum_name} "
+            f"USING (CASE status {case} END)::{enum_name}"
+        )
+
+    _create_pending_indexes("status = 'pending'")
@@ -0,0 +1,43 @@
+"""Add claimed_at to news for expiring stale claims
+
+Revision ID: add_news_claimed_at
+Revises: status_to_smallint
+Create Date: 2026-10-17 10:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'add_news_claimed_at'
+down_revision = 'status_to_smallint'
+branch_labels = None
+depends_on = None
+
+IN_PROGRESS = 3  # db_models.STATUS_CODES[StatusEnum.IN_PROGRESS]
+
+
+def upgrade() -> None:
+    """Add news.claimed_at and a partial index over IN_PROGRESS rows."""
+    op.add_column('news', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_news_in_progress_claimed_at',
+            'news',
+            ['claimed_at'],
+            postgresql_where=sa.text(f"status = {IN_PROGRESS}"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the index and column."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_news_in_progress_claimed_at',
+            table_name='news',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('news', 'claimed_at')
@@ -16,6 +16,11 @@ ISNA_SOURCE_NAME = "ISNA"
 
 PERSIAN_TO_LATIN = str.maketrans("۰۱۲۳۴۵۶۷۸۹", "0123456789")
 
+PERSIAN_MONTHS = {
+    "فروردین": 1, "اردیبهشت": 2, "خرداد": 3, "تیر": 4, "مرداد": 5,
+    "شهریور": 6, "مهر": 7, "آبان": 8, "آذر": 9, "دی": 10, "بهمن": 11, "اسفند": 12
+}
+
 
 class ISNADailyLinkCollector:
     """
@@ -105,11 +110,7 @@ class ISNADailyLinkCollector:
                 year = int("13" + year) if len(year) == 2 else int(year)
 
                 # Map Persian month names to month numbers
-                month_map = {
-                    "فروردین": 1, "اردیبهشت": 2, "خرداد": 3, "تیر": 4, "مرداد": 5,
-                    "شهریور": 6, "مهر": 7, "آبان": 8, "آذر": 9, "دی": 10, "بهمن": 11, "اسفند": 12
-                }
-                month = month_map.get(month_name, None)
+                month = PERSIAN_MONTHS.get(month_name)
                 if not month:
                     raise ValueError(f"Unknown month name: {month_name}")
 
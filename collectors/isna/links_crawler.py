@@ -18,6 +18,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from schema import NewsLinkData
 from database_manager import DatabaseManager
 
+PERSIAN_MONTHS = {
+    'فروردین': 1, 'اردیبهشت': 2, 'خرداد': 3, 'تیر': 4,
+    'مرداد': 5, 'شهریور': 6, 'مهر': 7, 'آبان': 8,
+    'آذر': 9, 'دی': 10, 'بهمن': 11, 'اسفند': 12
+}
+
 
 class ISNALinksCrawler:
     SOURCE_NAME = 'ISNA'
@@ -180,13 +186,8 @@ class ISNALinksCrawler:
             raise ValueError("Input string format is not valid.")
 
         parts = match.groupdict()
-        persian_months = {
-            'فروردین': 1, 'اردیبهشت': 2, 'خرداد': 3, 'تیر': 4,
-            'مرداد': 5, 'شهریور': 6, 'مهر': 7, 'آبان': 8,
-            'آذر': 9, 'دی': 10, 'بهمن': 11, 'اسفند': 12
-        }
         shamsi_year = int(parts['year'])
-        shamsi_month = persian_months.get(parts['month'])
+        shamsi_month = PERSIAN_MONTHS.get(parts['month'])
         shamsi_day = int(parts['day'])
         hour = int(parts['hour'])
         minute = int(parts['minute'])
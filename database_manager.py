@@ -1,11 +1,22 @@
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
-from datetime import timezone, datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import time
+from contextlib import contextmanager
+from datetime import timedelta
 
-from sqlalchemy import create_engine, select, update
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.orm import Session
+import orjson
+import psycopg
+from psycopg.errors import DeadlockDetected, SerializationFailure
+from psycopg.types.json import Json
+from sqlalchemy import (
+    create_engine, event, select, update, text, or_, func, distinct, bindparam, any_, true,
+    String, Integer, DateTime
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, sessionmaker
 
 from config import DatabaseConfig
 from db_models import Base, NewsLink, StatusEnum, NewsContent
@@ -13,14 +24,236 @@ from schema import NewsLinkData, NewsData
 
 logger = logging.getLogger(__name__)
 
+# Column order and PostgreSQL types for binary COPY (status is set server-side)
+NEWS_COPY_COLUMNS = (
+    'source', 'title', 'content', 'link', 'keywords', 'published_datetime',
+    'published_timestamp', 'images', 'summary',
+)
+NEWS_COPY_TYPES = (
+    'varchar', 'varchar', 'varchar', 'varchar', 'json', 'timestamptz',
+    'int4', 'json', 'varchar',
+)
+LINK_COPY_COLUMNS = ('source', 'link', 'published_datetime')
+LINK_COPY_TYPES = ('varchar', 'varchar', 'timestamptz')
+
+# Columns selected by the read paths, unpacked straight into NewsLinkData / NewsData
+NEWS_LINK_DATA_COLUMNS = (
+    NewsLink.source,
+    NewsLink.link,
+    NewsLink.published_datetime,
+)
+NEWS_DATA_COLUMNS = (
+    NewsContent.source,
+    NewsContent.title,
+    NewsContent.content,
+    NewsContent.link,
+    NewsContent.keywords,
+    NewsContent.published_datetime,
+    NewsContent.published_timestamp,
+    NewsContent.images,
+    NewsContent.summary,
+)
+
+# Status values for ORM expressions (StatusType converts them to codes)
+_PENDING, _COMPLETED, _FAILED, _IN_PROGRESS = (
+    status.value for status in (
+        StatusEnum.PENDING, StatusEnum.COMPLETED, StatusEnum.FAILED, StatusEnum.IN_PROGRESS,
+    )
+)
+
+# Lock-race errors; the transaction was rolled back, so it is safe to re-run
+TRANSIENT_ERRORS = (SerializationFailure, DeadlockDetected)
+TRANSIENT_RETRIES = 3
+
+
+def _is_disconnect(error: Exception) -> bool:
+    """True if error means the connection itself was lost."""
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated
+    # Raw psycopg error: only server-reported errors carry a SQLSTATE
+    return isinstance(error, psycopg.OperationalError) and error.sqlstate is None
+
+
+def _retry_transient(method=None, *, reconnect: bool = True):
+    """Retry lock-race failures, and disconnects unless reconnect=False."""
+    if method is None:
+        return functools.partial(_retry_transient, reconnect=reconnect)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        reconnected = False
+        attempt = 0
+        while True:
+            try:
+                return method(*args, **kwargs)
+            except (DBAPIError, psycopg.Error) as e:
+                # Errors from the raw psycopg cursors arrive unwrapped
+                driver_error = getattr(e, 'orig', e)
+                if reconnect and _is_disconnect(e) and not reconnected:
+                    reconnected = True
+                    logger.warning(f"Database connection lost in {method.__name__}, retrying once")
+                elif isinstance(driver_error, TRANSIENT_ERRORS) and attempt < TRANSIENT_RETRIES:
+                    logger.warning(
+                        f"{type(driver_error).__name__} in {method.__name__}, "
+                        f"retry {attempt + 1}/{TRANSIENT_RETRIES}"
+                    )
+                    time.sleep(0.01 * 2 ** attempt)
+                    attempt += 1
+                else:
+                    raise
+    return wrapper
+
+
+def _dumps_json(value) -> str:
+    """Serialize keywords/images with orjson, several times faster than json.dumps."""
+    return orjson.dumps(value).decode()
+
+
+def _chunked(items: List, size: int) -> Iterator[List]:
+    """Yield consecutive slices of items, each at most size long."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _unique_by_link(items: List) -> List:
+    """Drop items with a repeated link, keeping the last one."""
+    return list({item.link: item for item in items}.values())
+
+
+def _any_link(links: List[str]):
+    """Bind links as one text[] parameter for `link = ANY(...)` comparisons."""
+    return any_(bindparam('links', list(links), type_=ARRAY(String)))
+
+
+# Small news batches are bound as one array per column and unnested
+# server-side; JSON columns are bound as pre-serialized text.
+_UNNEST_BIND_TYPES = {
+    'varchar': ARRAY(String),
+    'json': ARRAY(String),
+    'timestamptz': ARRAY(DateTime(timezone=True)),
+    'int4': ARRAY(Integer),
+}
+_INSERT_NEWS_UNNEST_SQL = (
+    f"INSERT INTO {NewsContent.__tablename__} ({', '.join(NEWS_COPY_COLUMNS)}, status) "
+    f"SELECT u.*, {StatusEnum.PENDING.code} FROM unnest("
+    + ", ".join(
+        f"CAST(:{column} AS {pg_type}[])"
+        for column, pg_type in zip(NEWS_COPY_COLUMNS, NEWS_COPY_TYPES)
+    )
+    + f") AS u({', '.join(NEWS_COPY_COLUMNS)}) "
+    f"ON CONFLICT (link) DO NOTHING"
+)
+_UNNEST_BIND_PARAMS = [
+    bindparam(column, type_=_UNNEST_BIND_TYPES[pg_type])
+    for column, pg_type in zip(NEWS_COPY_COLUMNS, NEWS_COPY_TYPES)
+]
+INSERT_NEWS_UNNEST_STMT = text(_INSERT_NEWS_UNNEST_SQL).bindparams(*_UNNEST_BIND_PARAMS)
+
+# Links inserted the same way; the RETURNING variant reports the new rows
+_INSERT_LINKS_UNNEST_SQL = (
+    f"INSERT INTO {NewsLink.__tablename__} "
+    f"({', '.join(LINK_COPY_COLUMNS)}, status, tried_count) "
+    f"SELECT u.*, {StatusEnum.PENDING.code}, 0 FROM unnest("
+    + ", ".join(
+        f"CAST(:{column} AS {pg_type}[])"
+        for column, pg_type in zip(LINK_COPY_COLUMNS, LINK_COPY_TYPES)
+    )
+    + f") AS u({', '.join(LINK_COPY_COLUMNS)}) "
+    f"ON CONFLICT (link) DO NOTHING"
+)
+_LINK_UNNEST_BIND_PARAMS = [
+    bindparam(column, type_=_UNNEST_BIND_TYPES[pg_type])
+    for column, pg_type in zip(LINK_COPY_COLUMNS, LINK_COPY_TYPES)
+]
+INSERT_LINKS_UNNEST_STMT = text(_INSERT_LINKS_UNNEST_SQL).bindparams(*_LINK_UNNEST_BIND_PARAMS)
+INSERT_LINKS_RETURNING_STMT = text(
+    _INSERT_LINKS_UNNEST_SQL + f" RETURNING {', '.join(LINK_COPY_COLUMNS)}"
+).bindparams(*_LINK_UNNEST_BIND_PARAMS)
+
+# SET clauses of the link-keyed bulk UPDATEs (see _update_by_links)
+COMPLETED_SET = f"status = {StatusEnum.COMPLETED.code}"
+FAILED_SET = f"status = {StatusEnum.FAILED.code}"
+# A retried link that was claimed goes back to the queue, so the lease
+# reclaim does not count the same failed attempt a second time.
+RETRY_SET = (
+    "tried_count = tried_count + 1, last_tried_at = now(), "
+    f"status = CASE WHEN status = {StatusEnum.IN_PROGRESS.code} "
+    f"THEN {StatusEnum.PENDING.code} ELSE status END, "
+    "claimed_at = NULL"
+)
+
+# The news insert with the news_links completion as a data-modifying CTE
+INSERT_NEWS_COMPLETING_LINKS_STMT = text(
+    f"WITH completed AS ("
+    f"UPDATE {NewsLink.__tablename__} SET {COMPLETED_SET} "
+    f"WHERE link = ANY(:completed_links)) "
+    + _INSERT_NEWS_UNNEST_SQL
+).bindparams(
+    *_UNNEST_BIND_PARAMS, bindparam('completed_links', type_=ARRAY(String))
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _update_by_links_stmt(table: str, set_clause: str):
+    """UPDATE table SET set_clause WHERE link = ANY(:links), built once per pair."""
+    return text(
+        f"UPDATE {table} SET {set_clause} WHERE link = ANY(:links)"
+    ).bindparams(bindparam('links', type_=ARRAY(String)))
+
+# The given links with no stored article, in input order
+FILTER_UNPROCESSED_LINKS_STMT = text(
+    f"SELECT i.link FROM unnest(:links) WITH ORDINALITY AS i(link, n) "
+    f"WHERE NOT EXISTS (SELECT 1 FROM {NewsContent.__tablename__} AS news "
+    f"WHERE news.link = i.link) "
+    f"ORDER BY i.n"
+).bindparams(bindparam('links', type_=ARRAY(String)))
+
+# Monitoring counts polled on every scheduler tick
+COUNT_PENDING_NEWS_STMT = (
+    select(func.count())
+    .select_from(NewsContent)
+    .where(NewsContent.status == _PENDING)
+)
+COUNT_PENDING_NEWS_BY_SOURCE_STMT = COUNT_PENDING_NEWS_STMT.where(
+    NewsContent.source == bindparam('source')
+)
+COUNT_FAILED_LINKS_BY_SOURCE_STMT = (
+    select(func.count())
+    .select_from(NewsLink)
+    .where(NewsLink.source == bindparam('source'))
+    .where(NewsLink.status == _FAILED)
+)
+
 
 class DatabaseManager:
-    """
-    Optimized database manager with proper enum handling.
-    
-    IMPORTANT: All StatusEnum values use .value to get lowercase strings
-    that match PostgreSQL enum values.
-    """
+    """Optimized database manager; raw SQL must compare status to StatusEnum.X.code."""
+
+    # News batch size at which inserts switch from unnest to a pipelined
+    # executemany, and from that to COPY
+    executemany_threshold = 200
+    copy_threshold = 5000
+
+    # Seconds a get_processing_statistics result is reused
+    stats_cache_ttl = 30.0
+
+    # Seconds a pending news count is reused
+    pending_count_cache_ttl = 5.0
+
+    # Link-keyed UPDATEs of at least this many links join a COPYed temp table
+    temp_table_threshold = 10000
+
+    # Smaller ones are split into statements of at most this many links
+    update_chunk_size = 5000
+
+    # Below this many estimated news_links rows, a Bitmap Heap Scan + Sort
+    # is the right plan and check_pending_links_plan does not warn about it
+    plan_check_min_rows = 100000
+
+    # Seconds after which an IN_PROGRESS claim is returned to the queue
+    claim_lease_seconds = 900
+
+    # psycopg3's per-connection prepared statement cache size (default 100)
+    prepared_statements_max = 500
 
     def __init__(self, db_config: DatabaseConfig, max_retries: int = 3):
         self.db_config = db_config
@@ -33,105 +266,289 @@ class DatabaseManager:
 
         self.engine = create_engine(
             self.db_url,
-            pool_size=20,
-            max_overflow=40,
-            pool_pre_ping=True,
-            pool_recycle=3600,
+            # At most 50 server backends
+            pool_size=25,
+            max_overflow=25,
+            pool_recycle=1800,
+            # Reuse warm connections whose prepared statements are cached
+            pool_use_lifo=True,
+            query_cache_size=1200,
+            connect_args={
+                # Read and write timestamps in UTC, matching schema._ensure_utc
+                'options': '-c timezone=UTC',
+                # Prepare statements server-side from their second execution
+                'prepare_threshold': 1,
+            },
+            json_serializer=_dumps_json,
+        )
+
+        event.listen(self.engine, 'connect', self._configure_connection)
+
+        # Reads run in READ ONLY transactions; writes go through unit_of_work
+        self.read_engine = self.engine.execution_options(postgresql_readonly=True)
+        self.ReadOnlySession = sessionmaker(
+            bind=self.read_engine, autoflush=False, expire_on_commit=False
         )
+        self.WriteSession = sessionmaker(bind=self.engine, expire_on_commit=False)
+
+        # (computed_at, stats) from the last get_processing_statistics call
+        self._stats_cache: Optional[Tuple[float, dict]] = None
+        # source (None = all sources) -> (computed_at, pending news count)
+        self._pending_count_cache: Dict[Optional[str], Tuple[float, int]] = {}
+
+    @classmethod
+    def _configure_connection(cls, dbapi_conn, connection_record):
+        """Apply per-connection psycopg3 settings to each new connection."""
+        dbapi_conn.prepared_max = cls.prepared_statements_max
+
+    def close(self):
+        """Dispose of the engine's connection pool."""
+        self.engine.dispose()
+        logger.info("Database connection pool disposed.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @contextmanager
+    def unit_of_work(self, durable: bool = True) -> Iterator[Session]:
+        """Transactional Session; durable=False commits with synchronous_commit off."""
+        with self.WriteSession() as session:
+            with session.begin():
+                if not durable:
+                    session.execute(text("SET LOCAL synchronous_commit = off"))
+                yield session
 
     def initialize_database(self):
         """Creates the tables if they don't exist."""
         try:
             logger.info("Initializing database: creating tables...")
+            with self.engine.begin() as conn:
+                # Required by the trigram indexes on news title/content
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
             Base.metadata.create_all(self.engine)
             logger.info("Database initialization complete.")
         except Exception as e:
             logger.error(f"Could not connect to database or create tables: {e}")
             raise
 
-    def insert_news_batch_optimized(self, news_items: List[NewsData]) -> int:
-        """Optimized bulk insert using INSERT ... ON CONFLICT."""
+    @_retry_transient
+    def insert_news_batch_optimized(
+        self,
+        news_items: List[NewsData],
+        completed_links: Optional[List[str]] = None
+    ) -> int:
+        """Bulk insert news, skipping existing links, and optionally complete completed_links."""
         if not news_items:
             return 0
 
         start_time = time.time()
+
+        with self.unit_of_work(durable=not completed_links) as session:
+            inserted_count = self._insert_news_batch(session, news_items, completed_links)
+
+        duration = time.time() - start_time
         
-        with Session(self.engine) as session:
-            news_records = [
-                {
-                    'source': item.source,
-                    'title': item.title,
-                    'content': item.content,
-                    'link': item.link,
-                    'keywords': item.keywords,
-                    'published_datetime': item.published_datetime.replace(tzinfo=timezone.utc),
-                    'published_timestamp': item.published_timestamp,
-                    'images': item.images,
-                    'summary': item.summary,
-                    'status': StatusEnum.PENDING.value,  # FIXED: Use .value
-                }
-                for item in news_items
-            ]
-            
-            stmt = insert(NewsContent).values(news_records)
-            stmt = stmt.on_conflict_do_nothing(index_elements=['link'])
-            
-            result = session.execute(stmt)
-            session.commit()
-            
-            inserted_count = result.rowcount
-            duration = time.time() - start_time
-            
-            logger.info(
-                f"Bulk inserted {inserted_count}/{len(news_items)} news items "
-                f"in {duration:.2f}s ({inserted_count/duration:.0f} items/sec)"
+        logger.info(
+            f"Bulk inserted {inserted_count}/{len(news_items)} news items "
+            f"in {duration:.2f}s ({inserted_count/duration:.0f} items/sec)"
+        )
+        
+        return inserted_count
+
+    def _insert_news_batch(
+        self,
+        session: Session,
+        news_items: List[NewsData],
+        completed_links: Optional[List[str]] = None
+    ) -> int:
+        """insert_news_batch_optimized within the caller's transaction."""
+        unique_items = _unique_by_link(news_items)
+
+        if len(unique_items) >= self.copy_threshold:
+            return self._copy_news_batch(session, unique_items, completed_links)
+
+        if len(unique_items) >= self.executemany_threshold:
+            return self._pipeline_news_batch(session, unique_items, completed_links)
+
+        news_columns = {
+            'source': [item.source for item in unique_items],
+            'title': [item.title for item in unique_items],
+            'content': [item.content for item in unique_items],
+            'link': [item.link for item in unique_items],
+            'keywords': [
+                _dumps_json(item.keywords) if item.keywords is not None else None
+                for item in unique_items
+            ],
+            'published_datetime': [item.published_datetime for item in unique_items],
+            'published_timestamp': [item.published_timestamp for item in unique_items],
+            'images': [
+                _dumps_json(item.images) if item.images is not None else None
+                for item in unique_items
+            ],
+            'summary': [item.summary for item in unique_items],
+        }
+
+        if completed_links:
+            news_columns['completed_links'] = list(completed_links)
+            return session.execute(INSERT_NEWS_COMPLETING_LINKS_STMT, news_columns).rowcount
+
+        return session.execute(INSERT_NEWS_UNNEST_STMT, news_columns).rowcount
+
+    def _copy_news_batch(
+        self,
+        session: Session,
+        news_items: List[NewsData],
+        completed_links: Optional[List[str]] = None
+    ) -> int:
+        """COPY news into a staging table and merge it, within the session's transaction."""
+        table = NewsContent.__tablename__
+        columns = ", ".join(NEWS_COPY_COLUMNS)
+
+        dbapi_conn = session.connection().connection.driver_connection
+        with dbapi_conn.cursor() as cursor:
+            # One transaction may load several batches
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS news_stage ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
             )
-            
-            return inserted_count
+            cursor.execute("TRUNCATE news_stage")
+
+            with cursor.copy(
+                f"COPY news_stage ({columns}) FROM STDIN WITH (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(NEWS_COPY_TYPES)
+                for item in news_items:
+                    copy.write_row(self._news_row(item))
+
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}, status) "
+                f"SELECT {columns}, {StatusEnum.PENDING.code} FROM news_stage "
+                f"ON CONFLICT (link) DO NOTHING"
+            )
+            inserted_count = cursor.rowcount
+
+        if completed_links:
+            self._mark_links_completed(session, completed_links)
+        return inserted_count
+
+    @staticmethod
+    def _news_row(item: NewsData) -> tuple:
+        """Values of item in NEWS_COPY_COLUMNS order, JSON fields wrapped."""
+        return (
+            item.source,
+            item.title,
+            item.content,
+            item.link,
+            Json(item.keywords, dumps=_dumps_json) if item.keywords is not None else None,
+            item.published_datetime,
+            item.published_timestamp,
+            Json(item.images, dumps=_dumps_json) if item.images is not None else None,
+            item.summary,
+        )
+
+    @_retry_transient(reconnect=False)
+    def process_batch_commit(
+        self,
+        news_items: List[NewsData],
+        completed_links: List[str],
+        failed_links: Optional[List[str]] = None
+    ) -> int:
+        """Insert news, complete links and bump failed links' try counts in one transaction."""
+        if not news_items and not completed_links and not failed_links:
+            return 0
+
+        start_time = time.time()
+        unique_items = _unique_by_link(news_items)
+
+        with self.unit_of_work(durable=False) as session:
+            if len(unique_items) >= self.copy_threshold:
+                inserted_count = self._copy_news_batch(
+                    session, unique_items, completed_links
+                )
+                if failed_links:
+                    self._increment_link_try_count(session, failed_links)
+            else:
+                inserted_count = self._pipeline_news_batch(
+                    session, unique_items, completed_links, failed_links
+                )
+
+        logger.info(
+            f"Committed batch: {inserted_count}/{len(news_items)} news inserted, "
+            f"{len(completed_links or [])} links completed, "
+            f"{len(failed_links or [])} links retried "
+            f"in {time.time() - start_time:.2f}s"
+        )
+        return inserted_count
+
+    def _pipeline_news_batch(
+        self,
+        session: Session,
+        news_items: List[NewsData],
+        completed_links: Optional[List[str]] = None,
+        failed_links: Optional[List[str]] = None
+    ) -> int:
+        """Insert news with a pipelined psycopg3 executemany, then apply the link updates."""
+        columns = ", ".join(NEWS_COPY_COLUMNS)
+        placeholders = ", ".join(["%s"] * len(NEWS_COPY_COLUMNS))
+        inserted_count = 0
+
+        if news_items:
+            dbapi_conn = session.connection().connection.driver_connection
+            with dbapi_conn.cursor() as cursor:
+                with dbapi_conn.pipeline():
+                    cursor.executemany(
+                        f"INSERT INTO {NewsContent.__tablename__} ({columns}, status) "
+                        f"VALUES ({placeholders}, {StatusEnum.PENDING.code}) "
+                        f"ON CONFLICT (link) DO NOTHING",
+                        [self._news_row(item) for item in news_items],
+                    )
+                # Results are only available once the pipeline has synced
+                inserted_count = max(cursor.rowcount, 0)
+
+        if completed_links:
+            self._mark_links_completed(session, completed_links)
+        if failed_links:
+            self._increment_link_try_count(session, failed_links)
+        return inserted_count
 
+    @_retry_transient(reconnect=False)
     def increment_link_try_count(self, links: List[str]) -> int:
         """Increment the tried_count for a list of links."""
         if not links:
             return 0
         
-        with Session(self.engine) as session:
-            stmt = (
-                update(NewsLink)
-                .where(NewsLink.link.in_(links))
-                .values(
-                    tried_count=NewsLink.tried_count + 1,
-                    last_tried_at=datetime.now(timezone.utc)
-                )
-            )
-            
-            result = session.execute(stmt)
-            session.commit()
-            
-            updated_count = result.rowcount
-            logger.info(f"Incremented try count for {updated_count} links")
+        with self.unit_of_work(durable=False) as session:
+            updated_count = self._increment_link_try_count(session, links)
             
-            return updated_count
+        logger.info(f"Incremented try count for {updated_count} links")
+        
+        return updated_count
+
+    def _increment_link_try_count(self, session: Session, links: List[str]) -> int:
+        """increment_link_try_count within the caller's transaction."""
+        return self._update_by_links(session, NewsLink.__tablename__, RETRY_SET, links)
     
+    @_retry_transient
     def mark_links_as_failed(self, links: List[str]) -> int:
         """Mark links as FAILED when they exceed max retry attempts."""
         if not links:
             return 0
         
-        with Session(self.engine) as session:
-            stmt = (
-                update(NewsLink)
-                .where(NewsLink.link.in_(links))
-                .values(status=StatusEnum.FAILED.value)  # FIXED: Added .value
-            )
+        with self.unit_of_work(durable=False) as session:
+            updated_count = self._mark_links_as_failed(session, links)
             
-            result = session.execute(stmt)
-            session.commit()
-            
-            updated_count = result.rowcount
-            logger.warning(f"Marked {updated_count} links as FAILED (exceeded max retries)")
-            
-            return updated_count
+        logger.warning(f"Marked {updated_count} links as FAILED (exceeded max retries)")
+        
+        return updated_count
+
+    def _mark_links_as_failed(self, session: Session, links: List[str]) -> int:
+        """mark_links_as_failed within the caller's transaction."""
+        return self._update_by_links(session, NewsLink.__tablename__, FAILED_SET, links)
     
+    @_retry_transient
     def get_pending_links_by_source(
         self, 
         source: str, 
@@ -139,51 +556,206 @@ class DatabaseManager:
         exclude_max_retries: bool = True
     ) -> List[NewsLinkData]:
         """Fetch pending links efficiently."""
-        with Session(self.engine) as session:
-            stmt = (
-                select(NewsLink)
-                .where(NewsLink.source == source)
-                .where(NewsLink.status == StatusEnum.PENDING.value)  # FIXED: Added .value
+        return list(self.iter_pending_links_by_source(
+            source, limit=limit, exclude_max_retries=exclude_max_retries
+        ))
+
+    def iter_pending_links_by_source(
+        self,
+        source: str,
+        limit: Optional[int] = None,
+        exclude_max_retries: bool = True,
+        batch_size: int = 500
+    ) -> Iterator[NewsLinkData]:
+        """Yield pending links oldest first, streaming large results."""
+        stmt = self._pending_links_stmt(source, limit, exclude_max_retries)
+
+        if limit is None or limit > batch_size:
+            stmt = stmt.execution_options(yield_per=batch_size)
+
+        with self.ReadOnlySession() as session:
+            for row in session.execute(stmt).mappings():
+                yield NewsLinkData(**row)
+
+    def _pending_links_stmt(
+        self, source: str, limit: Optional[int], exclude_max_retries: bool
+    ):
+        """The oldest-first pending links query behind iter_pending_links_by_source."""
+        stmt = (
+            select(*NEWS_LINK_DATA_COLUMNS)
+            .where(NewsLink.source == source)
+            .where(NewsLink.status == _PENDING)
+        )
+
+        if exclude_max_retries:
+            stmt = stmt.where(NewsLink.tried_count < self.max_retries)
+
+        stmt = stmt.order_by(NewsLink.published_datetime.asc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    @_retry_transient
+    def check_pending_links_plan(self, source: str, limit: int = 50) -> bool:
+        """Warn and return False if the pending links query sorts instead of using its index."""
+        with self.read_engine.connect() as conn:
+            estimated_rows = conn.scalar(
+                text("SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                {'table': NewsLink.__tablename__},
             )
-            
-            if exclude_max_retries:
-                stmt = stmt.where(NewsLink.tried_count < self.max_retries)
-            
-            stmt = (
-                stmt.order_by(NewsLink.published_datetime.asc())
-                .limit(limit)
+        if (estimated_rows or 0) < self.plan_check_min_rows:
+            return True
+
+        compiled = self._pending_links_stmt(source, limit, True).compile(
+            dialect=self.read_engine.dialect,
+            compile_kwargs={'literal_binds': True},
+        )
+        with self.read_engine.connect() as conn:
+            plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}").scalar()
+
+        node_types = []
+        nodes = [plan[0]['Plan']]
+        while nodes:
+            node = nodes.pop()
+            node_types.append(node['Node Type'])
+            nodes.extend(node.get('Plans', []))
+
+        if 'Sort' in node_types:
+            logger.warning(
+                f"Pending links query for {source} sorts instead of using "
+                f"ix_news_links_source_pending (plan: {' > '.join(node_types)})"
             )
-            
-            orm_links = session.scalars(stmt).all()
-            
-            return [
-                NewsLinkData(
-                    source=link.source,
-                    link=link.link,
-                    published_datetime=link.published_datetime,
-                )
-                for link in orm_links
-            ]
-    
+            return False
+        return True
+
+    @_retry_transient(reconnect=False)
+    def claim_pending_links_by_source(
+        self, source: str, limit: int = 50
+    ) -> List[NewsLinkData]:
+        """Atomically claim up to limit of the oldest pending links of source."""
+        claimed = (
+            select(NewsLink.id)
+            .where(NewsLink.source == source)
+            .where(NewsLink.status == _PENDING)
+            .where(NewsLink.tried_count < self.max_retries)
+            .order_by(NewsLink.published_datetime.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte('claimed')
+        )
+
+        stmt = (
+            update(NewsLink)
+            .where(NewsLink.id == claimed.c.id)
+            .values(status=_IN_PROGRESS, claimed_at=func.now())
+            .returning(*NEWS_LINK_DATA_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+
+        with self.unit_of_work() as session:
+            self._reclaim_stale_links(session, source)
+            links = [NewsLinkData(**row) for row in session.execute(stmt).mappings()]
+
+        # UPDATE ... RETURNING does not preserve the CTE's ordering
+        links.sort(key=lambda link: link.published_datetime)
+
+        if links:
+            logger.info(f"Claimed {len(links)} pending links for {source}")
+
+        return links
+
+    def _reclaim_stale_links(self, session: Session, source: Optional[str] = None) -> int:
+        """Return expired link claims to PENDING, counting each as a failed attempt."""
+        stmt = (
+            update(NewsLink)
+            .where(NewsLink.status == _IN_PROGRESS)
+            .where(
+                NewsLink.claimed_at
+                < func.now() - timedelta(seconds=self.claim_lease_seconds)
+            )
+            .values(
+                status=_PENDING,
+                claimed_at=None,
+                tried_count=NewsLink.tried_count + 1,
+                last_tried_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if source is not None:
+            stmt = stmt.where(NewsLink.source == source)
+
+        reclaimed = session.execute(stmt).rowcount
+        if reclaimed:
+            logger.warning(f"Reclaimed {reclaimed} links from expired claims")
+        return reclaimed
+
+    @_retry_transient
+    def release_claimed_links(self, links: List[str]) -> int:
+        """Return claimed (IN_PROGRESS) links to PENDING."""
+        if not links:
+            return 0
+
+        with self.unit_of_work() as session:
+            return session.execute(
+                update(NewsLink)
+                .where(NewsLink.link == _any_link(links))
+                .where(NewsLink.status == _IN_PROGRESS)
+                .values(status=_PENDING, claimed_at=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+    @_retry_transient
     def get_failed_links_count_by_source(self, source: str) -> int:
         """Get count of failed links for a specific source."""
-        with Session(self.engine) as session:
-            from sqlalchemy import func
-            stmt = (
-                select(func.count())
-                .select_from(NewsLink)
-                .where(NewsLink.source == source)
-                .where(NewsLink.status == StatusEnum.FAILED.value)  # FIXED: Added .value
-            )
-            count = session.scalar(stmt)
+        with self.ReadOnlySession() as session:
+            count = session.scalar(COUNT_FAILED_LINKS_BY_SOURCE_STMT, {'source': source})
             return count or 0
-    
+
+    @_retry_transient
+    def get_source_overview(self, sources: List[str]) -> Dict[str, dict]:
+        """Get pending/failed counts and oldest pending time per source in one query."""
+        if not sources:
+            return {}
+
+        pending = NewsLink.status == _PENDING
+        stmt = (
+            select(
+                NewsLink.source,
+                func.count().filter(pending).label('pending_count'),
+                func.count()
+                .filter(NewsLink.status == _FAILED)
+                .label('failed_count'),
+                func.min(NewsLink.published_datetime)
+                .filter(pending)
+                .label('oldest_pending_at'),
+            )
+            .where(NewsLink.source == any_(bindparam('sources', list(sources), type_=ARRAY(String))))
+            .group_by(NewsLink.source)
+        )
+
+        with self.ReadOnlySession() as session:
+            rows = session.execute(stmt).all()
+
+        overview = {
+            source: {'pending_count': 0, 'failed_count': 0, 'oldest_pending_at': None}
+            for source in sources
+        }
+        for row in rows:
+            overview[row.source] = {
+                'pending_count': row.pending_count,
+                'failed_count': row.failed_count,
+                'oldest_pending_at': row.oldest_pending_at,
+            }
+        return overview
+
+    @_retry_transient
     def get_links_exceeding_retries(self, source: Optional[str] = None) -> List[str]:
-        """Get links that have exceeded max retries but are still marked as PENDING."""
-        with Session(self.engine) as session:
+        """Get links that have exceeded max retries but are still PENDING or IN_PROGRESS."""
+        with self.ReadOnlySession() as session:
             stmt = (
                 select(NewsLink.link)
-                .where(NewsLink.status == StatusEnum.PENDING.value)  # FIXED: Added .value
+                .where(NewsLink.status.in_([_PENDING, _IN_PROGRESS]))
                 .where(NewsLink.tried_count >= self.max_retries)
             )
             
@@ -193,19 +765,32 @@ class DatabaseManager:
             links = session.scalars(stmt).all()
             return list(links)
     
+    @_retry_transient
     def cleanup_exceeded_retries(self, source: Optional[str] = None) -> int:
-        """Mark all links that exceeded max retries as FAILED."""
-        exceeded_links = self.get_links_exceeding_retries(source)
-        
-        if exceeded_links:
-            logger.info(
-                f"Found {len(exceeded_links)} links exceeding max retries "
-                f"({self.max_retries}). Marking as FAILED..."
+        """Mark all pending or claimed links that exceeded max retries as FAILED."""
+        stmt = (
+            update(NewsLink)
+            .where(NewsLink.status.in_([_PENDING, _IN_PROGRESS]))
+            .where(NewsLink.tried_count >= self.max_retries)
+            .values(status=_FAILED, claimed_at=None)
+            .execution_options(synchronize_session=False)
+        )
+
+        if source:
+            stmt = stmt.where(NewsLink.source == source)
+
+        with self.unit_of_work(durable=False) as session:
+            failed_count = session.execute(stmt).rowcount
+
+        if failed_count:
+            logger.warning(
+                f"Marked {failed_count} links as FAILED "
+                f"(exceeded max retries of {self.max_retries})"
             )
-            return self.mark_links_as_failed(exceeded_links)
-        
-        return 0
 
+        return failed_count
+
+    @_retry_transient
     def mark_links_completed_optimized(self, links: List[str]) -> int:
         """Mark multiple links as completed in a single UPDATE query."""
         if not links:
@@ -213,218 +798,557 @@ class DatabaseManager:
 
         start_time = time.time()
         
-        with Session(self.engine) as session:
-            stmt = (
-                update(NewsLink)
-                .where(NewsLink.link.in_(links))
-                .values(status=StatusEnum.COMPLETED.value)  # FIXED: Added .value
-            )
-            
-            result = session.execute(stmt)
-            session.commit()
+        with self.unit_of_work(durable=False) as session:
+            updated_count = self._mark_links_completed(session, links)
             
-            updated_count = result.rowcount
-            duration = time.time() - start_time
-            
-            logger.info(
-                f"Marked {updated_count} links as completed in {duration:.3f}s"
+        duration = time.time() - start_time
+        
+        logger.info(
+            f"Marked {updated_count} links as completed in {duration:.3f}s"
+        )
+        
+        return updated_count
+
+    def _mark_links_completed(self, session: Session, links: List[str]) -> int:
+        """mark_links_completed_optimized within the caller's transaction."""
+        updated_count = self._update_by_links(
+            session, NewsLink.__tablename__, COMPLETED_SET, links
+        )
+        self._warn_unmatched(NewsLink.__tablename__, links, updated_count)
+        return updated_count
+
+    def _update_by_links(
+        self, session: Session, table: str, set_clause: str, links: List[str]
+    ) -> int:
+        """Apply set_clause to table's rows matching links, via a temp table for large batches."""
+        unique_links = list(dict.fromkeys(links))
+
+        if len(unique_links) < self.temp_table_threshold:
+            stmt = _update_by_links_stmt(table, set_clause)
+            return sum(
+                session.execute(stmt, {'links': chunk}).rowcount
+                for chunk in _chunked(unique_links, self.update_chunk_size)
             )
-            
-            return updated_count
 
+        dbapi_conn = session.connection().connection.driver_connection
+        with dbapi_conn.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS target_links "
+                "(link text PRIMARY KEY) ON COMMIT DROP"
+            )
+            cursor.execute("TRUNCATE target_links")
+            with cursor.copy("COPY target_links (link) FROM STDIN") as copy:
+                for link in unique_links:
+                    copy.write_row((link,))
+            cursor.execute(
+                f"UPDATE {table} SET {set_clause} "
+                f"FROM target_links WHERE {table}.link = target_links.link"
+            )
+            return cursor.rowcount
+
+    @staticmethod
+    def _warn_unmatched(table: str, links: List[str], updated_count: int):
+        """Log when an UPDATE by link matched fewer rows than requested."""
+        missing = len(set(links)) - updated_count
+        if missing > 0:
+            logger.warning(f"{missing} of the given links were not found in {table}")
+
+    @_retry_transient
     def filter_unprocessed_links(self, links: List[str]) -> List[str]:
         """Filter out links that are already processed."""
         if not links:
             return []
         
-        with Session(self.engine) as session:
-            stmt = (
-                select(NewsContent.link)
-                .where(NewsContent.link.in_(links))
+        with self.ReadOnlySession() as session:
+            unprocessed = list(
+                session.scalars(FILTER_UNPROCESSED_LINKS_STMT, {'links': links})
             )
             
-            existing_links = set(session.scalars(stmt).all())
-            unprocessed = [link for link in links if link not in existing_links]
-            
             logger.info(
                 f"Filtered: {len(unprocessed)}/{len(links)} links are unprocessed"
             )
             
             return unprocessed
 
+    @_retry_transient
     def insert_new_links(self, links: List[NewsLinkData]) -> int:
         """Insert links with ON CONFLICT handling"""
         if not links:
             return 0
 
-        with Session(self.engine) as session:
-            link_records = [
-                {
-                    'source': link_data.source,
-                    'link': link_data.link,
-                    'published_datetime': link_data.published_datetime.replace(tzinfo=timezone.utc),
-                    'status': StatusEnum.PENDING.value,  # FIXED: Added .value
-                    'tried_count': 0,
-                }
-                for link_data in links
-            ]
-            
-            stmt = insert(NewsLink).values(link_records)
-            stmt = stmt.on_conflict_do_nothing(index_elements=['link'])
-            
-            result = session.execute(stmt)
-            session.commit()
-            
-            inserted_count = result.rowcount
+        unique_links = _unique_by_link(links)
+
+        if len(unique_links) >= self.copy_threshold:
+            # Bulk archive backfills can be re-walked, so skip the WAL flush
+            with self.unit_of_work(durable=False) as session:
+                inserted_count = self._copy_links_batch(session, unique_links)
             logger.info(f"Inserted {inserted_count} new links.")
             return inserted_count
 
-    def insert_news_batch(self, news_items: List[NewsData]) -> int:
+        with self.unit_of_work() as session:
+            existing = set(
+                session.scalars(
+                    select(NewsLink.link).where(
+                        NewsLink.link == _any_link([link_data.link for link_data in unique_links])
+                    )
+                )
+            )
+
+            new_links = [
+                link_data for link_data in unique_links
+                if link_data.link not in existing
+            ]
+
+            if not new_links:
+                logger.info(f"All {len(links)} links already exist, nothing to insert.")
+                return 0
+
+            inserted_count = session.execute(
+                INSERT_LINKS_UNNEST_STMT, self._link_columns(new_links)
+            ).rowcount
+
+        logger.info(f"Inserted {inserted_count} new links.")
+        return inserted_count
+
+    @_retry_transient(reconnect=False)
+    def insert_new_links_returning(self, links: List[NewsLinkData]) -> List[NewsLinkData]:
+        """Insert links and return the ones that were new."""
+        if not links:
+            return []
+
+        params = self._link_columns(_unique_by_link(links))
+
+        with self.unit_of_work() as session:
+            inserted = [
+                NewsLinkData(**row)
+                for row in session.execute(INSERT_LINKS_RETURNING_STMT, params).mappings()
+            ]
+
+        logger.info(f"Inserted {len(inserted)}/{len(links)} new links.")
+        return inserted
+
+    @staticmethod
+    def _link_columns(links: List[NewsLinkData]) -> Dict[str, list]:
+        """Bind parameters for the unnest link inserts: one list per column."""
+        return {
+            column: [getattr(link_data, column) for link_data in links]
+            for column in LINK_COPY_COLUMNS
+        }
+
+    def _copy_links_batch(self, session: Session, links: List[NewsLinkData]) -> int:
+        """COPY links into a staging table and merge it, within the session's transaction."""
+        table = NewsLink.__tablename__
+        columns = ", ".join(LINK_COPY_COLUMNS)
+
+        dbapi_conn = session.connection().connection.driver_connection
+        with dbapi_conn.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS links_stage ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            cursor.execute("TRUNCATE links_stage")
+
+            with cursor.copy(
+                f"COPY links_stage ({columns}) FROM STDIN WITH (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(LINK_COPY_TYPES)
+                for link_data in links:
+                    copy.write_row((
+                        link_data.source, link_data.link, link_data.published_datetime
+                    ))
+
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}, status, tried_count) "
+                f"SELECT {columns}, {StatusEnum.PENDING.code}, 0 FROM links_stage "
+                f"ON CONFLICT (link) DO NOTHING"
+            )
+            return cursor.rowcount
+
+    def insert_news_batch(
+        self,
+        news_items: List[NewsData],
+        completed_links: Optional[List[str]] = None
+    ) -> int:
         """Alias to optimized method"""
-        return self.insert_news_batch_optimized(news_items)
+        return self.insert_news_batch_optimized(news_items, completed_links)
     
     def mark_links_completed(self, links: List[str]) -> int:
         """Alias to optimized method"""
         return self.mark_links_completed_optimized(links)
 
+    @_retry_transient
     def get_pending_news_batch(self, limit: int = 50) -> List[NewsData]:
         """Fetch pending news from ALL SOURCES."""
-        with Session(self.engine) as session:
-            stmt = (
-                select(NewsContent)
-                .where(NewsContent.status == StatusEnum.PENDING.value)  # FIXED: Added .value
-                .order_by(NewsContent.published_datetime.asc())
-                .limit(limit)
-            )
-            orm_news = session.scalars(stmt).all()
-
-            return [
-                NewsData(
-                    source=n.source,
-                    title=n.title,
-                    content=n.content,
-                    link=n.link,
-                    keywords=n.keywords,
-                    published_datetime=n.published_datetime,
-                    published_timestamp=n.published_timestamp,
-                    images=n.images,
-                    summary=n.summary,
-                )
-                for n in orm_news
-            ]
+        return list(self.iter_pending_news(limit=limit))
 
+    @_retry_transient
     def get_pending_news_batch_by_source(self, source: str, limit: int = 50) -> List[NewsData]:
         """Fetch pending news for a SPECIFIC SOURCE."""
-        with Session(self.engine) as session:
-            stmt = (
-                select(NewsContent)
-                .where(NewsContent.source == source)
-                .where(NewsContent.status == StatusEnum.PENDING.value)  # FIXED: Added .value
-                .order_by(NewsContent.published_datetime.asc())
-                .limit(limit)
+        news_list = list(self.iter_pending_news(source=source, limit=limit))
+        
+        if news_list:
+            logger.info(
+                f"Fetched {len(news_list)} pending news items for source '{source}'"
             )
-            orm_news = session.scalars(stmt).all()
-
-            news_list = [
-                NewsData(
-                    source=n.source,
-                    title=n.title,
-                    content=n.content,
-                    link=n.link,
-                    keywords=n.keywords,
-                    published_datetime=n.published_datetime,
-                    published_timestamp=n.published_timestamp,
-                    images=n.images,
-                    summary=n.summary,
-                )
-                for n in orm_news
-            ]
-            
-            if news_list:
-                logger.info(
-                    f"Fetched {len(news_list)} pending news items for source '{source}'"
-                )
-            
-            return news_list
+        
+        return news_list
 
-    def get_pending_count_by_source(self, source: str) -> int:
-        """Get count of pending news items for a specific source."""
-        with Session(self.engine) as session:
-            from sqlalchemy import func
-            stmt = (
-                select(func.count())
-                .select_from(NewsContent)
-                .where(NewsContent.source == source)
-                .where(NewsContent.status == StatusEnum.PENDING.value)  # FIXED: Added .value
+    @_retry_transient
+    def get_pending_news_batch_multi(
+        self, sources: List[str], per_source_limit: int = 50
+    ) -> Dict[str, List[NewsData]]:
+        """Fetch up to per_source_limit pending news for each source in one query."""
+        if not sources:
+            return {}
+
+        source_list = (
+            func.unnest(bindparam('sources', list(sources), type_=ARRAY(String)))
+            .table_valued('source')
+            .render_derived(name='s')
+        )
+        per_source = (
+            select(*NEWS_DATA_COLUMNS)
+            .where(NewsContent.source == source_list.c.source)
+            .where(NewsContent.status == _PENDING)
+            .order_by(NewsContent.published_datetime.asc())
+            .limit(bindparam('per_source_limit', per_source_limit))
+            .lateral('pending')
+        )
+        stmt = select(per_source).select_from(source_list).join(per_source, true())
+
+        batches: Dict[str, List[NewsData]] = {source: [] for source in sources}
+        with self.ReadOnlySession() as session:
+            for row in session.execute(stmt).mappings():
+                batches[row['source']].append(NewsData(**row))
+
+        logger.info(
+            f"Fetched {sum(map(len, batches.values()))} pending news items "
+            f"for {len(sources)} sources"
+        )
+        return batches
+
+    @_retry_transient(reconnect=False)
+    def claim_pending_news_batch(
+        self, limit: int = 50, source: Optional[str] = None
+    ) -> List[NewsData]:
+        """Atomically claim up to limit of the oldest pending news."""
+        claimed = (
+            select(NewsContent.id)
+            .where(NewsContent.status == _PENDING)
+        )
+        if source is not None:
+            claimed = claimed.where(NewsContent.source == source)
+        claimed = (
+            claimed
+            .order_by(NewsContent.published_datetime.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte('claimed')
+        )
+
+        stmt = (
+            update(NewsContent)
+            .where(NewsContent.id == claimed.c.id)
+            .values(status=_IN_PROGRESS, claimed_at=func.now())
+            .returning(*NEWS_DATA_COLUMNS)
+            .execution_options(synchronize_session=False)
+        )
+
+        with self.unit_of_work() as session:
+            self._reclaim_stale_news(session, source)
+            news_list = [NewsData(**row) for row in session.execute(stmt).mappings()]
+
+        news_list.sort(key=lambda news: news.published_datetime)
+
+        if news_list:
+            logger.info(f"Claimed {len(news_list)} pending news items")
+
+        return news_list
+
+    def _reclaim_stale_news(self, session: Session, source: Optional[str] = None) -> int:
+        """Return news claimed more than claim_lease_seconds ago to PENDING."""
+        stmt = (
+            update(NewsContent)
+            .where(NewsContent.status == _IN_PROGRESS)
+            .where(
+                NewsContent.claimed_at
+                < func.now() - timedelta(seconds=self.claim_lease_seconds)
             )
-            count = session.scalar(stmt)
-            return count or 0
+            .values(status=_PENDING, claimed_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        if source is not None:
+            stmt = stmt.where(NewsContent.source == source)
+
+        reclaimed = session.execute(stmt).rowcount
+        if reclaimed:
+            logger.warning(f"Reclaimed {reclaimed} news items from expired claims")
+        return reclaimed
 
-    def get_total_pending_count(self) -> int:
+    @_retry_transient
+    def release_claimed_news(self, links: List[str]) -> int:
+        """Return claimed (IN_PROGRESS) news to PENDING, e.g. after a failed batch."""
+        if not links:
+            return 0
+
+        with self.unit_of_work() as session:
+            return session.execute(
+                update(NewsContent)
+                .where(NewsContent.link == _any_link(links))
+                .where(NewsContent.status == _IN_PROGRESS)
+                .values(status=_PENDING, claimed_at=None)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+    def iter_pending_news(
+        self,
+        source: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 100
+    ) -> Iterator[NewsData]:
+        """Yield pending news oldest first, streaming large results."""
+        stmt = select(*NEWS_DATA_COLUMNS).where(
+            NewsContent.status == _PENDING
+        )
+
+        if source is not None:
+            stmt = stmt.where(NewsContent.source == source)
+
+        stmt = stmt.order_by(NewsContent.published_datetime.asc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        if limit is None or limit > batch_size:
+            stmt = stmt.execution_options(yield_per=batch_size)
+
+        with self.ReadOnlySession() as session:
+            for row in session.execute(stmt).mappings():
+                yield NewsData(**row)
+
+    def get_pending_count_by_source(self, source: str, use_cache: bool = True) -> int:
+        """Get count of pending news items for a specific source."""
+        return self._count_pending_news(source, use_cache)
+
+    def get_total_pending_count(self, use_cache: bool = True) -> int:
         """Get total count of pending news items across ALL sources."""
-        with Session(self.engine) as session:
-            from sqlalchemy import func
-            stmt = (
-                select(func.count())
-                .select_from(NewsContent)
-                .where(NewsContent.status == StatusEnum.PENDING.value)  # FIXED: Added .value
-            )
-            count = session.scalar(stmt)
-            return count or 0
+        return self._count_pending_news(None, use_cache)
+
+    @_retry_transient
+    def get_all_pending_counts(self) -> Dict[Optional[str], int]:
+        """Get pending news counts per source, with the total under None."""
+        stmt = (
+            select(NewsContent.source, func.count().label('count'))
+            .where(NewsContent.status == _PENDING)
+            .group_by(func.rollup(NewsContent.source))
+        )
+
+        with self.ReadOnlySession() as session:
+            counts = {row.source: row.count for row in session.execute(stmt)}
+        counts.setdefault(None, 0)
+
+        now = time.monotonic()
+        self._pending_count_cache = {
+            source: (now, count) for source, count in counts.items()
+        }
+        return counts
+
+    @_retry_transient
+    def _count_pending_news(self, source: Optional[str], use_cache: bool) -> int:
+        """Count pending news for source (None = all), cached for pending_count_cache_ttl."""
+        cached = self._pending_count_cache.get(source)
+        if use_cache and cached and time.monotonic() - cached[0] < self.pending_count_cache_ttl:
+            return cached[1]
 
+        with self.ReadOnlySession() as session:
+            if source is None:
+                count = session.scalar(COUNT_PENDING_NEWS_STMT)
+            else:
+                count = session.scalar(COUNT_PENDING_NEWS_BY_SOURCE_STMT, {'source': source})
+        count = count or 0
+
+        self._pending_count_cache[source] = (time.monotonic(), count)
+        return count
+
+    @_retry_transient
     def mark_news_completed(self, links: List[str]) -> int:
         """Mark news as completed"""
         if not links:
             return 0
 
-        with Session(self.engine) as session:
-            stmt = (
-                update(NewsContent)
-                .where(NewsContent.link.in_(links))
-                .values(status=StatusEnum.COMPLETED.value)  # FIXED: Added .value
-            )
-            result = session.execute(stmt)
-            session.commit()
-            return result.rowcount
+        with self.unit_of_work() as session:
+            return self._mark_news_completed(session, links)
+
+    def _mark_news_completed(self, session: Session, links: List[str]) -> int:
+        """mark_news_completed within the caller's transaction."""
+        updated_count = self._update_by_links(
+            session, NewsContent.__tablename__, COMPLETED_SET, links
+        )
+        self._warn_unmatched(NewsContent.__tablename__, links, updated_count)
+        return updated_count
     
-    def get_retry_statistics(self, source: Optional[str] = None) -> dict:
-        """Get retry statistics for monitoring."""
-        with Session(self.engine) as session:
-            from sqlalchemy import func
-            
-            stmt = (
+    @_retry_transient
+    def get_processing_statistics(self, use_cache: bool = True) -> dict:
+        """Get processing statistics, cached for stats_cache_ttl."""
+        cached = self._stats_cache
+        if use_cache and cached and time.monotonic() - cached[0] < self.stats_cache_ttl:
+            return cached[1]
+
+        with self.read_engine.connect() as conn:
+            links = conn.execute(
                 select(
-                    NewsLink.tried_count,
-                    func.count().label('count')
-                )
+                    func.count().label('total_links'),
+                    func.count()
+                    .filter(NewsLink.status == _COMPLETED)
+                    .label('processed_links'),
+                    func.count()
+                    .filter(NewsLink.status == _FAILED)
+                    .label('failed_links'),
+                    func.count()
+                    .filter(NewsLink.status == _IN_PROGRESS)
+                    .label('in_progress_links'),
+                    func.count(distinct(NewsLink.source)).label('total_sources'),
+                ).select_from(NewsLink)
+            ).one()
+
+            unprocessed_links = conn.scalar(
+                select(func.count())
                 .select_from(NewsLink)
-                .where(NewsLink.status == StatusEnum.PENDING.value)  # FIXED: Added .value
+                .where(NewsLink.status == _PENDING)
             )
-            
-            if source:
-                stmt = stmt.where(NewsLink.source == source)
-            
-            stmt = stmt.group_by(NewsLink.tried_count).order_by(NewsLink.tried_count)
-            
+
+            news = conn.execute(
+                select(
+                    func.count().label('total_articles'),
+                    func.count()
+                    .filter(NewsContent.status == _PENDING)
+                    .label('pending_articles'),
+                    func.count()
+                    .filter(NewsContent.status == _IN_PROGRESS)
+                    .label('in_progress_articles'),
+                ).select_from(NewsContent)
+            ).one()
+
+            stats = {
+                'total_links': links.total_links,
+                'processed_links': links.processed_links,
+                'unprocessed_links': unprocessed_links or 0,
+                'failed_links': links.failed_links,
+                'in_progress_links': links.in_progress_links,
+                'total_sources': links.total_sources,
+                'total_articles': news.total_articles,
+                'pending_articles': news.pending_articles,
+                'in_progress_articles': news.in_progress_articles,
+            }
+
+        self._stats_cache = (time.monotonic(), stats)
+        return stats
+
+    @_retry_transient
+    def get_retry_statistics(self, source: Optional[str] = None) -> dict:
+        """Get retry statistics for monitoring."""
+        stmt = (
+            select(
+                NewsLink.tried_count,
+                func.count().label('count')
+            )
+            .select_from(NewsLink)
+            .where(NewsLink.status.in_([_PENDING, _IN_PROGRESS]))
+        )
+        
+        if source:
+            stmt = stmt.where(NewsLink.source == source)
+        
+        stmt = stmt.group_by(NewsLink.tried_count).order_by(NewsLink.tried_count)
+        
+        with self.ReadOnlySession() as session:
             results = session.execute(stmt).all()
-            
-            retry_distribution = {row.tried_count: row.count for row in results}
-            
-            near_max_stmt = (
-                select(func.count())
-                .select_from(NewsLink)
-                .where(NewsLink.status == StatusEnum.PENDING.value)  # FIXED: Added .value
-                .where(NewsLink.tried_count >= self.max_retries - 1)
+        
+        retry_distribution = {row.tried_count: row.count for row in results}
+        near_max_count = sum(
+            count for tried_count, count in retry_distribution.items()
+            if tried_count >= self.max_retries - 1
+        )
+        
+        return {
+            'retry_distribution': retry_distribution,
+            'near_max_retries': near_max_count,
+            'max_retries': self.max_retries,
+            'source': source or 'ALL'
+        }
+
+    @_retry_transient
+    def search_news_by_text(
+        self,
+        query: str,
+        source: Optional[str] = None,
+        limit: int = 20
+    ) -> List[NewsData]:
+        """Case-insensitive substring search over news title and content."""
+        escaped = (
+            query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        pattern = f"%{escaped}%"
+
+        with self.ReadOnlySession() as session:
+            stmt = (
+                select(*NEWS_DATA_COLUMNS)
+                .where(or_(
+                    NewsContent.title.ilike(pattern, escape="\\"),
+                    NewsContent.content.ilike(pattern, escape="\\"),
+                ))
             )
-            
+
             if source:
-                near_max_stmt = near_max_stmt.where(NewsLink.source == source)
-            
-            near_max_count = session.scalar(near_max_stmt) or 0
-            
-            return {
-                'retry_distribution': retry_distribution,
-                'near_max_retries': near_max_count,
-                'max_retries': self.max_retries,
-                'source': source or 'ALL'
-            }
\ No newline at end of file
+                stmt = stmt.where(NewsContent.source == source)
+
+            stmt = stmt.order_by(NewsContent.published_datetime.desc()).limit(limit)
+
+            return [
+                NewsData(**row)
+                for row in session.execute(stmt).mappings()
+            ]
+
+
+class PrefetchingFetcher:
+    """Hands out pending news batches, prefetching the next one in the background."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        batch_size: int,
+        source: Optional[str] = None
+    ):
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.source = source
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._next: Optional[Future] = None
+
+    def _fetch(self, in_flight: List[str]) -> List[NewsData]:
+        """Fetch the oldest batch_size pending news not in in_flight."""
+        limit = self.batch_size + len(in_flight)
+        if self.source:
+            batch = self.db_manager.get_pending_news_batch_by_source(self.source, limit=limit)
+        else:
+            batch = self.db_manager.get_pending_news_batch(limit=limit)
+
+        skip = set(in_flight)
+        return [news for news in batch if news.link not in skip][:self.batch_size]
+
+    def next_batch(self) -> List[NewsData]:
+        """Return the prefetched batch (or fetch one now) and prefetch the next."""
+        future, self._next = self._next, None
+        batch = future.result() if future else self._fetch([])
+
+        if batch:
+            self._next = self._executor.submit(self._fetch, [news.link for news in batch])
+
+        return batch
+
+    def close(self):
+        """Stop the background worker, discarding any pending prefetch."""
+        if self._next:
+            self._next.cancel()
+            self._next = None
+        self._executor.shutdown(wait=False)
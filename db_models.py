@@ -1,7 +1,10 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, DateTime, Integer, JSON, Enum
+from sqlalchemy import (
+    String, DateTime, Integer, SmallInteger, JSON, Index, CheckConstraint, text
+)
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 import enum
 
@@ -19,6 +22,46 @@ class StatusEnum(str, enum.Enum):
     PENDING = "pending"
     COMPLETED = "completed"
     FAILED = "failed"  # NEW: For links that exceeded max retries
+    IN_PROGRESS = "in_progress"  # Claimed by a worker, not yet completed
+
+    @property
+    def code(self) -> int:
+        """smallint stored in the status columns; use it in raw SQL."""
+        return STATUS_CODES[self]
+
+
+STATUS_CODES = {
+    StatusEnum.PENDING: 0,
+    StatusEnum.COMPLETED: 1,
+    StatusEnum.FAILED: 2,
+    StatusEnum.IN_PROGRESS: 3,
+}
+STATUS_BY_CODE = {code: status for status, code in STATUS_CODES.items()}
+
+
+class StatusType(TypeDecorator):
+    """
+    Stores StatusEnum as a smallint code. Binds accept a StatusEnum or its
+    string value (e.g. StatusEnum.PENDING.value); results are StatusEnum.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return StatusEnum(value).code
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return STATUS_BY_CODE[value]
+
+
+def _status_check(table: str) -> CheckConstraint:
+    """CHECK constraint limiting a status column to the known codes."""
+    codes = ", ".join(str(code) for code in STATUS_CODES.values())
+    return CheckConstraint(f"status IN ({codes})", name=f"ck_{table}_status")
 
 
 # --- Matches NewsLinkData ---
@@ -31,8 +74,36 @@ class NewsLink(Base):
     NEW FIELDS:
     - tried_count: Number of times the link was attempted to be crawled
     - last_tried_at: Last time the link was attempted
+    
+    The partial index on (source, published_datetime) covers only PENDING
+    rows, so the per-source queue fetch is an ordered index range scan.
+    published_datetime also has a BRIN index for wide date-range scans over
+    this append-mostly table. A partial index on claimed_at over
+    IN_PROGRESS rows finds stale claims.
+
+    The table has a fillfactor of 70 (set by migration) so retry updates,
+    which only touch the unindexed tried_count/last_tried_at, can stay
+    on-page (HOT). Status changes cannot: status appears in the partial
+    index predicates, so every transition updates the indexes.
     """
     __tablename__ = "news_links"
+    __table_args__ = (
+        _status_check("news_links"),
+        Index(
+            'ix_news_links_source_pending', 'source', 'published_datetime',
+            postgresql_where=text(f"status = {StatusEnum.PENDING.code}"),
+            postgresql_include=['link'],
+        ),
+        Index(
+            'ix_news_links_in_progress_claimed_at', 'claimed_at',
+            postgresql_where=text(f"status = {StatusEnum.IN_PROGRESS.code}"),
+        ),
+        Index(
+            'ix_news_links_published_datetime_brin', 'published_datetime',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 64},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
@@ -40,9 +111,9 @@ class NewsLink(Base):
     link: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
     published_datetime: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
-    # Status field - FIXED: Added values_callable
+    # Status field - stored as a smallint code, see StatusType
     status: Mapped[StatusEnum] = mapped_column(
-        Enum(StatusEnum, name="news_link_status", values_callable=lambda x: [e.value for e in x]),
+        StatusType(),
         nullable=False,
         default=StatusEnum.PENDING,
     )
@@ -61,6 +132,11 @@ class NewsLink(Base):
         comment="Last time the link was attempted"
     )
 
+    # When a worker claimed the row (status IN_PROGRESS)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
     def __repr__(self) -> str:
         return (
             f"NewsLink(id={self.id!r}, link={self.link[:50]!r}, "
@@ -87,8 +163,42 @@ class NewsContent(Base):
     """
     Stores full news data (title, body, keywords, etc.).
     Mirrors NewsData.
+    
+    Trigram GIN indexes on title/content (pg_trgm) serve substring searches.
+    Only LIKE/ILIKE (or the % operator) can use them; similarity() > x
+    comparisons bypass the index. published_datetime has a BRIN index for
+    date-range scans. A partial index on (source, published_datetime) over
+    PENDING rows serves the embedding queue fetch, and one on claimed_at
+    over IN_PROGRESS rows finds stale claims.
     """
     __tablename__ = "news"
+    __table_args__ = (
+        _status_check("news"),
+        Index(
+            'ix_news_source_pending', 'source', 'published_datetime',
+            postgresql_where=text(f"status = {StatusEnum.PENDING.code}"),
+            postgresql_include=['link'],
+        ),
+        Index(
+            'ix_news_in_progress_claimed_at', 'claimed_at',
+            postgresql_where=text(f"status = {StatusEnum.IN_PROGRESS.code}"),
+        ),
+        Index(
+            'ix_news_title_trgm', 'title',
+            postgresql_using='gin',
+            postgresql_ops={'title': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_news_content_trgm', 'content',
+            postgresql_using='gin',
+            postgresql_ops={'content': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_news_published_datetime_brin', 'published_datetime',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 64},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
@@ -103,13 +213,18 @@ class NewsContent(Base):
     images: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
     summary: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    # Status field - FIXED: Added values_callable
+    # Status field - stored as a smallint code, see StatusType
     status: Mapped[StatusEnum] = mapped_column(
-        Enum(StatusEnum, name="news_content_status", values_callable=lambda x: [e.value for e in x]),
+        StatusType(),
         nullable=False,
         default=StatusEnum.PENDING,
     )
 
+    # When a worker claimed the row (status IN_PROGRESS)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
     def __repr__(self) -> str:
         return (
             f"NewsContent(id={self.id!r}, title={self.title[:30]!r}, "
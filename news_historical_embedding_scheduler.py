@@ -36,7 +36,7 @@ import time
 import sys
 from typing import Optional
 
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, PrefetchingFetcher
 from vector_db_manager import VectorDBManager
 from config import settings
 
@@ -70,6 +70,9 @@ class EmbeddingScheduler:
         self.poll_interval = poll_interval
         self.source = source  # None = ALL sources (default)
         
+        # Fetches batch K+1 while batch K is being embedded
+        self.fetcher = PrefetchingFetcher(db_manager, batch_size, source=source)
+        
         # Statistics
         self.total_processed = 0
         self.total_errors = 0
@@ -78,15 +81,7 @@ class EmbeddingScheduler:
 
     def _fetch_pending_batch(self):
         """Fetch pending news batch based on source filter."""
-        if self.source:
-            return self.db_manager.get_pending_news_batch_by_source(
-                source=self.source,
-                limit=self.batch_size
-            )
-        else:
-            return self.db_manager.get_pending_news_batch(
-                limit=self.batch_size
-            )
+        return self.fetcher.next_batch()
 
     def _log_statistics(self):
         """Log processing statistics"""
@@ -258,6 +253,9 @@ class EmbeddingScheduler:
             self._log_statistics()
             raise
 
+        finally:
+            self.fetcher.close()
+
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -351,17 +351,12 @@ class HistoricalPageScheduler:
         try:
             results: Dict[str, NewsData] = self.collector.crawl_batch(pending_links)
             
+            news_items = []
             if results:
                 logger.info(f"✅ Successfully crawled {len(results)} pages")
                 successful_links = list(results.keys())
                 self.total_processed += len(results)
-                
-                # Insert news data
                 news_items = list(results.values())
-                self.db_manager.insert_news_batch(news_items)
-                
-                # Mark as completed
-                self.db_manager.mark_links_completed(successful_links)
             
             # Identify failed links
             all_links = {link.link for link in pending_links}
@@ -371,18 +366,21 @@ class HistoricalPageScheduler:
             if failed_links:
                 logger.warning(f"❌ {len(failed_links)} links failed to crawl")
                 self.total_failed += len(failed_links)
-                
-                # Increment try count
-                self.db_manager.increment_link_try_count(failed_links)
-                
-                # Check for exceeded retries
-                exceeded = self.db_manager.get_links_exceeding_retries(source=self.source)
+            
+            # Insert news, mark links completed and increment failed try
+            # counts in one pipelined transaction
+            self.db_manager.process_batch_commit(
+                news_items, successful_links, failed_links=failed_links
+            )
+            
+            if failed_links:
+                # Mark links that exceeded max retries as FAILED
+                exceeded = self.db_manager.cleanup_exceeded_retries(source=self.source)
                 if exceeded:
                     logger.warning(
-                        f"⚠️  {len(exceeded)} links exceeded max retries "
-                        f"({self.max_retries}). Marking as FAILED..."
+                        f"⚠️  {exceeded} links exceeded max retries "
+                        f"({self.max_retries}). Marked as FAILED"
                     )
-                    self.db_manager.mark_links_as_failed(exceeded)
         
         except Exception as e:
             logger.error(f"Error processing batch: {e}", exc_info=True)
@@ -485,6 +483,9 @@ class HistoricalPageScheduler:
         if cleaned > 0:
             logger.warning(f"Marked {cleaned} links as FAILED (exceeded max retries)")
         
+        # Make sure the pending-links queue query is served by its index
+        self.db_manager.check_pending_links_plan(self.source, limit=self.batch_size)
+        
         # Log initial pending count
         initial_pending = self.db_manager.get_pending_count_by_source(self.source)
         logger.info(f"📊 Initial pending links: {initial_pending}")
@@ -1,8 +1,18 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 
+def _ensure_utc(value: datetime) -> datetime:
+    """Label published datetimes as UTC, as the insert paths always have."""
+    # Aware values (e.g. ISNA's Asia/Tehran times) are relabelled, not
+    # converted, to stay consistent with stored rows. Converting them needs
+    # a backfill migration shifting those rows too.
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
 @dataclass
 class NewsLinkData:
     """Typed data class for news links, aligned with the news_links table schema"""
@@ -10,6 +20,9 @@ class NewsLinkData:
     link: str
     published_datetime: datetime
 
+    def __post_init__(self):
+        self.published_datetime = _ensure_utc(self.published_datetime)
+
 
 @dataclass
 class NewsData:
@@ -24,6 +37,9 @@ class NewsData:
     images: Optional[list[str]]
     summary: Optional[str] = None
 
+    def __post_init__(self):
+        self.published_datetime = _ensure_utc(self.published_datetime)
+
 
 @dataclass
 class LinksCollectingMetrics:
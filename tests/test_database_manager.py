@@ -0,0 +1,62 @@
+"""
+Integration tests for DatabaseManager.
+
+They need a PostgreSQL database reachable through the POSTGRES_* settings
+(see config.DatabaseConfig) and are skipped when none is available.
+"""
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("psycopg")
+
+from sqlalchemy import delete
+from sqlalchemy.exc import OperationalError
+
+from config import DatabaseConfig
+from database_manager import DatabaseManager
+from db_models import NewsLink
+from schema import NewsLinkData
+
+
+@pytest.fixture
+def db_manager():
+    manager = DatabaseManager(DatabaseConfig())
+    try:
+        manager.initialize_database()
+    except OperationalError as e:
+        manager.close()
+        pytest.skip(f"PostgreSQL not available: {e}")
+
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def source(db_manager):
+    source = f"test-{uuid.uuid4().hex[:12]}"
+    yield source
+    with db_manager.unit_of_work() as session:
+        session.execute(delete(NewsLink).where(NewsLink.source == source))
+
+
+def _links(source: str, count: int):
+    published = datetime(2026, 10, 17, tzinfo=timezone.utc)
+    return [
+        NewsLinkData(source=source, link=f"https://{source}.test/{i}", published_datetime=published)
+        for i in range(count)
+    ]
+
+
+def test_insert_new_links_counts_only_new_rows(db_manager, source):
+    links = _links(source, 5)
+
+    assert db_manager.insert_new_links(links[:3]) == 3
+    # Two already stored, one repeated within the batch
+    assert db_manager.insert_new_links(links + [links[4]]) == 2
+    assert db_manager.insert_new_links(links) == 0
+
+    pending = db_manager.get_pending_links_by_source(source, limit=10)
+    assert sorted(link.link for link in pending) == sorted(link.link for link in links)